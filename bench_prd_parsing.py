@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Throughput benchmark for bulk PRD parsing.
+Measures documents/second and peak RSS across document sizes, worker counts
+and source formats (a directory of files or a single JSONL file).
+
+Usage: python bench_prd_parsing.py [--docs 2000] [--workers 1 4] [--sources dir jsonl]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from github_repo_management.prd_corpus import iter_directory, iter_jsonl, parse_corpus
+
+# Document size name -> number of features in each synthetic PRD
+SIZES = {
+    "small": 5,
+    "medium": 50,
+    "large": 500,
+}
+
+
+def make_prd(index: int, feature_count: int) -> str:
+    """Build a synthetic PRD with the sections PRDParserTool looks for."""
+    features = "\n".join(
+        f"- Feature {n}: users must be able to manage item {n} with optional filters"
+        for n in range(feature_count)
+    )
+    return (
+        f"# Project {index}\n\n"
+        f"## Description\n"
+        f"A benchmark project used to measure PRD parsing throughput, document {index}.\n\n"
+        f"## Tech Stack\n"
+        f"- Python\n- FastAPI\n- PostgreSQL\n- React\n\n"
+        f"## Features\n{features}\n"
+    )
+
+
+def run_case(size: str, source: str, docs: int, workers: int, chunksize: int) -> dict:
+    """Run a single benchmark case in the current process."""
+    with tempfile.TemporaryDirectory() as tmp:
+        if source == "jsonl":
+            corpus = os.path.join(tmp, "corpus.jsonl")
+            with open(corpus, "w", encoding="utf-8") as f:
+                for i in range(docs):
+                    f.write(json.dumps({"id": f"prd_{i:06d}", "prd_content": make_prd(i, SIZES[size])}) + "\n")
+            items = iter_jsonl(corpus)
+        else:
+            corpus = os.path.join(tmp, "corpus")
+            os.makedirs(corpus)
+            for i in range(docs):
+                with open(os.path.join(corpus, f"prd_{i:06d}.md"), "w", encoding="utf-8") as f:
+                    f.write(make_prd(i, SIZES[size]))
+            items = iter_directory(corpus)
+
+        stats = parse_corpus(
+            items,
+            os.path.join(tmp, "results.jsonl"),
+            workers=workers,
+            chunksize=chunksize,
+        )
+
+    return {
+        "size": size,
+        "source": source,
+        "workers": workers,
+        "docs": stats.documents,
+        "avg_kb": stats.total_bytes / max(stats.documents, 1) / 1024,
+        "docs_per_s": stats.docs_per_second,
+        "rss_parent_kb": stats.peak_rss_kb["parent"],
+        "rss_worker_kb": stats.peak_rss_kb["children"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=2000, help="Documents per case")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--sources", nargs="+", choices=["dir", "jsonl"], default=["dir", "jsonl"])
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        # Child mode: one case per interpreter so peak RSS isn't polluted by earlier cases
+        print(json.dumps(run_case(args.sizes[0], args.sources[0], args.docs, args.workers[0], args.chunksize)))
+        return
+
+    print("=" * 86)
+    print(f"{'size':<8}{'source':<8}{'workers':>8}{'docs':>8}{'avg KB':>10}{'docs/s':>12}"
+          f"{'RSS parent':>16}{'RSS worker':>16}")
+    print("=" * 86)
+    for size in args.sizes:
+        for source in args.sources:
+            for workers in args.workers:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--single", "--sizes", size, "--sources", source,
+                     "--workers", str(workers), "--docs", str(args.docs), "--chunksize", str(args.chunksize)],
+                    check=True, capture_output=True, text=True,
+                ).stdout
+                row = json.loads(output.strip().splitlines()[-1])
+                print(
+                    f"{row['size']:<8}{row['source']:<8}{row['workers']:>8}{row['docs']:>8}{row['avg_kb']:>10.1f}"
+                    f"{row['docs_per_s']:>12.1f}{row['rss_parent_kb']:>13} KB{row['rss_worker_kb']:>13} KB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+"""
+Org-wide bulk repository operations.
+
+Applies a label set and/or a README to every repository in an organization
+that matches the given filters, without running the LLM crew. Repositories
+are processed concurrently with bounded parallelism, and finished
+repositories are recorded in a state file so interrupted runs can resume.
+"""
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from string import Template
+from typing import Dict, Iterator, List, Optional
+
+from github import Github, GithubException, UnknownObjectException
+
+
+@dataclass
+class RepoResult:
+    """Outcome of applying the bulk changes to one repository."""
+    repo: str
+    status: str  # "done" or "failed"
+    changes: List[str] = field(default_factory=list)
+    error: str = ""
+
+
+class BulkState:
+    """
+    Resumable run state, persisted as JSON after every repository.
+
+    The state is tied to a fingerprint of the requested changes, so a state
+    file left over from a run with different labels or README is ignored.
+    """
+
+    def __init__(self, path: str, fingerprint: str = ""):
+        self.path = path
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self.repos: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("fingerprint") == fingerprint:
+                self.repos = data.get("repos", {})
+
+    def is_done(self, repo_name: str) -> bool:
+        return self.repos.get(repo_name, {}).get("status") == "done"
+
+    def record(self, result: RepoResult) -> None:
+        with self._lock:
+            self.repos[result.repo] = {"status": result.status, "changes": result.changes, "error": result.error}
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": self.fingerprint, "repos": self.repos}, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def change_fingerprint(labels, readme_template, commit_message) -> str:
+    payload = json.dumps([labels, readme_template, commit_message], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def list_org_repos(
+    g: Github,
+    org: str,
+    topics: Optional[List[str]] = None,
+    name_pattern: Optional[str] = None,
+    include_archived: bool = False,
+) -> Iterator:
+    """
+    Yield repositories of an organization matching the filters.
+
+    Pages are fetched lazily as the iterator advances. A repository must carry
+    every topic in `topics`; `name_pattern` is a shell-style glob on the name.
+    """
+    for repo in g.get_organization(org).get_repos(type="all"):
+        if repo.archived and not include_archived:
+            continue
+        if name_pattern and not fnmatch.fnmatch(repo.name, name_pattern):
+            continue
+        # topics are included in the list response, so this costs no extra request
+        if topics and not set(topics).issubset(repo.topics or []):
+            continue
+        yield repo
+
+
+def sync_labels(repo, labels: List[Dict[str, str]], dry_run: bool = False) -> List[str]:
+    """Create missing labels and update ones whose color or description differ."""
+    existing = {label.name.lower(): label for label in repo.get_labels()}
+    changes = []
+
+    for label_data in labels:
+        name = label_data['name']
+        color = label_data.get('color', 'ededed').lstrip('#').lower()
+        description = label_data.get('description', '')
+        current = existing.get(name.lower())
+
+        if current is None:
+            changes.append(f"create label '{name}'")
+            if not dry_run:
+                repo.create_label(name=name, color=color, description=description)
+        elif current.color.lower() != color or (current.description or '') != description:
+            changes.append(f"update label '{name}'")
+            if not dry_run:
+                current.edit(name=name, color=color, description=description)
+
+    return changes
+
+
+def sync_readme(repo, template: str, commit_message: str, dry_run: bool = False) -> List[str]:
+    """
+    Write the repository README from a template, skipping ones already up to date.
+
+    The existing README is located with get_readme(), so readme.md or
+    docs/README.md is updated in place rather than shadowed by a new
+    README.md. READMEs in other formats (e.g. README.rst) are left untouched
+    and reported as skipped. Repositories without a README get README.md.
+    The template may use $repo_name, $full_name and $description placeholders.
+    """
+    content = Template(template).safe_substitute(
+        repo_name=repo.name,
+        full_name=repo.full_name,
+        description=repo.description or "",
+    )
+
+    try:
+        readme = repo.get_readme()
+    except UnknownObjectException:
+        readme = None
+
+    if readme is None:
+        if not dry_run:
+            repo.create_file(path="README.md", message=commit_message, content=content)
+        return ["create README.md"]
+
+    if not readme.path.lower().endswith(".md"):
+        return [f"skip README (existing {readme.path} is not Markdown)"]
+
+    if readme.decoded_content.decode("utf-8") == content:
+        return []
+
+    if not dry_run:
+        repo.update_file(path=readme.path, message=commit_message, content=content, sha=readme.sha)
+    return [f"update {readme.path}"]
+
+
+def apply_to_repo(
+    repo,
+    labels: Optional[List[Dict[str, str]]],
+    readme_template: Optional[str],
+    commit_message: str,
+    dry_run: bool,
+) -> RepoResult:
+    try:
+        changes = []
+        if labels:
+            changes.extend(sync_labels(repo, labels, dry_run))
+        if readme_template is not None:
+            changes.extend(sync_readme(repo, readme_template, commit_message, dry_run))
+        return RepoResult(repo=repo.full_name, status="done", changes=changes)
+    except GithubException as e:
+        message = e.data.get('message', str(e)) if isinstance(e.data, dict) else str(e)
+        return RepoResult(repo=repo.full_name, status="failed", error=f"GitHub API Error: {message}")
+    except Exception as e:
+        return RepoResult(repo=repo.full_name, status="failed", error=str(e))
+
+
+def run_bulk(
+    repos,
+    labels: Optional[List[Dict[str, str]]] = None,
+    readme_template: Optional[str] = None,
+    commit_message: str = "Update README.md",
+    concurrency: int = 8,
+    dry_run: bool = False,
+    state: Optional[BulkState] = None,
+) -> List[RepoResult]:
+    """
+    Apply label/README changes across repositories with bounded parallelism.
+
+    At most `concurrency` repositories are in flight at once, and enumeration
+    only runs ahead of the workers by that much. Repositories already marked
+    done in `state` are skipped; dry runs never write state.
+    """
+    results = []
+    skipped = 0
+
+    def report(result: RepoResult) -> None:
+        results.append(result)
+        if state is not None and not dry_run:
+            state.record(result)
+        if result.status == "done":
+            summary = ", ".join(result.changes) or "no changes"
+            prefix = "would " if dry_run and result.changes else ""
+            print(f"[{len(results)}] ✓ {result.repo}: {prefix}{summary}")
+        else:
+            print(f"[{len(results)}] ✗ {result.repo}: {result.error}")
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = set()
+        for repo in repos:
+            if state is not None and state.is_done(repo.full_name):
+                skipped += 1
+                continue
+            if len(pending) >= concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report(future.result())
+            pending.add(executor.submit(apply_to_repo, repo, labels, readme_template, commit_message, dry_run))
+
+        for future in wait(pending).done:
+            report(future.result())
+
+    failed = sum(1 for result in results if result.status == "failed")
+    print("\n" + "=" * 50)
+    print(f"{'Dry run' if dry_run else 'Bulk update'} complete: "
+          f"{len(results) - failed} succeeded, {failed} failed, {skipped} skipped (already done)")
+    print("=" * 50)
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Apply labels and README updates across an organization")
+    parser.add_argument("org", help="GitHub organization to enumerate")
+    parser.add_argument("--labels", help="JSON file with a list of labels ('name', 'color', optional 'description')")
+    parser.add_argument("--readme", help="README template file ($repo_name, $full_name, $description are substituted)")
+    parser.add_argument("--commit-message", default="Update README.md", help="Commit message for README changes")
+    parser.add_argument("--topic", action="append", dest="topics", help="Only repos with this topic (repeatable)")
+    parser.add_argument("--name-pattern", help="Only repos whose name matches this glob, e.g. 'service-*'")
+    parser.add_argument("--include-archived", action="store_true", help="Include archived repositories")
+    parser.add_argument("--concurrency", type=int, default=8, help="Repositories processed in parallel")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without applying them")
+    parser.add_argument("--state-file", help="Resume state file (default: .bulk_ops_<org>.json)")
+    args = parser.parse_args(argv)
+
+    if not args.labels and not args.readme:
+        parser.error("nothing to do: pass --labels and/or --readme")
+    return args
+
+
+def run_org(args: argparse.Namespace) -> List[RepoResult]:
+    """Load the requested changes and apply them across the organization."""
+    token = os.getenv("GITHUB_TOKEN")
+    if not token:
+        raise Exception("GITHUB_TOKEN not found in environment variables")
+
+    labels = None
+    if args.labels:
+        with open(args.labels, encoding="utf-8") as f:
+            labels = json.load(f)
+
+    readme_template = None
+    if args.readme:
+        with open(args.readme, encoding="utf-8") as f:
+            readme_template = f.read()
+
+    g = Github(token, per_page=100)
+    repos = list_org_repos(g, args.org, args.topics, args.name_pattern, args.include_archived)
+    state = BulkState(
+        args.state_file or f".bulk_ops_{args.org}.json",
+        fingerprint=change_fingerprint(labels, readme_template, args.commit_message),
+    )
+
+    return run_bulk(
+        repos,
+        labels=labels,
+        readme_template=readme_template,
+        commit_message=args.commit_message,
+        concurrency=args.concurrency,
+        dry_run=args.dry_run,
+        state=state,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Apply labels and/or a README across an organization's repositories.
+
+    Usage: bulk_repo_ops <org> [--labels labels.json] [--readme README.md] [options]
+    Exits with status 1 if any repository failed.
+    """
+    results = run_org(parse_args(argv))
+    return 1 if any(result.status == "failed" for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
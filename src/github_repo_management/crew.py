@@ -1,5 +1,5 @@
 from crewai import Agent, Crew, Process, Task
-from crewai.project import CrewBase, agent, crew, task
+from crewai.project import CrewBase, agent, crew, task, before_kickoff, after_kickoff
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
 from github_repo_management.tools import (
@@ -7,8 +7,25 @@ from github_repo_management.tools import (
     CreateRepositoryTool,
     CreateIssueTool,
     CreateLabelsTool,
-    UpdateReadmeTool
+    UpdateReadmeTool,
+    KnowledgeSearchTool
 )
+from github_repo_management.model_routing import (
+    FAST,
+    LARGE,
+    ModelRouter,
+    validate_prd_data,
+    validate_repository
+)
+
+# Mechanical extraction and tool calls run on the fast model,
+# PRD generation and issue drafting on the large one.
+AGENT_MODEL_TIERS = {
+    'prd_generator': LARGE,
+    'prd_analyst': FAST,
+    'repository_creator': FAST,
+    'issue_manager': LARGE,
+}
 
 @CrewBase
 class GithubRepoManagement():
@@ -17,10 +34,28 @@ class GithubRepoManagement():
     agents: List[BaseAgent]
     tasks: List[Task]
 
+    @property
+    def router(self) -> ModelRouter:
+        if not hasattr(self, '_router'):
+            self._router = ModelRouter(AGENT_MODEL_TIERS)
+        return self._router
+
+    @before_kickoff
+    def start_routing_report(self, inputs):
+        self.router.start_run()
+        return inputs
+
+    @after_kickoff
+    def print_routing_report(self, result):
+        self.router.report()
+        return result
+
     @agent
     def prd_generator(self) -> Agent:
         return Agent(
             config=self.agents_config['prd_generator'], # type: ignore[index]
+            llm=self.router.llm_for('prd_generator'),
+            tools=[KnowledgeSearchTool()],
             verbose=True
         )
 
@@ -28,7 +63,8 @@ class GithubRepoManagement():
     def prd_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config['prd_analyst'], # type: ignore[index]
-            tools=[PRDParserTool()],
+            llm=self.router.llm_for('prd_analyst'),
+            tools=self.router.track_tools('prd_analyst', [PRDParserTool()]),
             verbose=True
         )
 
@@ -36,11 +72,12 @@ class GithubRepoManagement():
     def repository_creator(self) -> Agent:
         return Agent(
             config=self.agents_config['repository_creator'], # type: ignore[index]
-            tools=[
+            llm=self.router.llm_for('repository_creator'),
+            tools=self.router.track_tools('repository_creator', [
                 CreateRepositoryTool(),
                 CreateLabelsTool(),
                 UpdateReadmeTool()
-            ],
+            ]),
             verbose=True
         )
 
@@ -48,7 +85,8 @@ class GithubRepoManagement():
     def issue_manager(self) -> Agent:
         return Agent(
             config=self.agents_config['issue_manager'], # type: ignore[index]
-            tools=[CreateIssueTool()],
+            llm=self.router.llm_for('issue_manager'),
+            tools=[CreateIssueTool(), KnowledgeSearchTool()],
             verbose=True
         )
 
@@ -56,24 +94,30 @@ class GithubRepoManagement():
     def generate_prd_task(self) -> Task:
         return Task(
             config=self.tasks_config['generate_prd_task'], # type: ignore[index]
+            callback=self.router.task_callback('generate_prd_task', 'prd_generator'),
         )
 
     @task
     def analyze_prd_task(self) -> Task:
         return Task(
             config=self.tasks_config['analyze_prd_task'], # type: ignore[index]
+            callback=self.router.task_callback('analyze_prd_task', 'prd_analyst'),
+            guardrail=self.router.escalating_guardrail('prd_analyst', self.prd_analyst(), validate_prd_data),
         )
 
     @task
     def create_repository_task(self) -> Task:
         return Task(
             config=self.tasks_config['create_repository_task'], # type: ignore[index]
+            callback=self.router.task_callback('create_repository_task', 'repository_creator'),
+            guardrail=self.router.escalating_guardrail('repository_creator', self.repository_creator(), validate_repository),
         )
 
     @task
     def create_issues_task(self) -> Task:
         return Task(
             config=self.tasks_config['create_issues_task'], # type: ignore[index]
+            callback=self.router.task_callback('create_issues_task', 'issue_manager'),
         )
 
     @crew
@@ -0,0 +1,208 @@
+"""
+On-disk embedding index for the project's knowledge/ directory.
+
+Files are chunked and embedded once; the index is persisted next to the
+knowledge files and keyed by each file's content hash, so reloading only
+re-embeds files that were added or changed since the last run.
+"""
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+DEFAULT_KNOWLEDGE_DIR = "knowledge"
+INDEX_FILENAME = ".index.json"
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_EXTENSIONS = (".txt", ".md")
+
+Embedder = Callable[[List[str]], List[List[float]]]
+
+_WHITESPACE = re.compile(r"\s")
+
+
+def openai_embedder(model: str = DEFAULT_EMBEDDING_MODEL, batch_size: int = 100) -> Embedder:
+    """Build an embedder backed by the OpenAI embeddings API (uses OPENAI_API_KEY)."""
+    from openai import OpenAI
+
+    client = OpenAI()
+
+    def embed(texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for start in range(0, len(texts), batch_size):
+            response = client.embeddings.create(model=model, input=texts[start:start + batch_size])
+            vectors.extend(item.embedding for item in response.data)
+        return vectors
+
+    return embed
+
+
+def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
+    """Split text into overlapping chunks, breaking on whitespace where possible."""
+    if overlap >= chunk_size:
+        raise ValueError(f"overlap ({overlap}) must be smaller than chunk_size ({chunk_size})")
+
+    text = text.strip()
+    if len(text) <= chunk_size:
+        return [text] if text else []
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            # Back off to the last whitespace so words aren't cut in half; searching
+            # past start + overlap keeps the next start after this one
+            split = text.rfind(" ", start + overlap + 1, end)
+            if split == -1:
+                split = text.rfind("\n", start + overlap + 1, end)
+            if split != -1:
+                end = split
+        chunks.append(text[start:end].strip())
+        if end >= len(text):
+            break
+
+        next_start = end - overlap
+        # Move forward to the next word boundary so chunks don't start mid-word
+        boundary = _WHITESPACE.search(text, next_start, end)
+        if boundary:
+            next_start = boundary.end()
+        # Always make progress, even when a single token spans the whole window
+        start = next_start if next_start > start else end
+    return [chunk for chunk in chunks if chunk]
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+class KnowledgeIndex:
+    """Chunked, embedded view of a knowledge directory with top-k retrieval."""
+
+    def __init__(
+        self,
+        knowledge_dir: str = DEFAULT_KNOWLEDGE_DIR,
+        embedder: Optional[Embedder] = None,
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        chunk_size: int = 1000,
+        overlap: int = 200,
+    ):
+        if overlap >= chunk_size:
+            raise ValueError(f"overlap ({overlap}) must be smaller than chunk_size ({chunk_size})")
+
+        self.knowledge_dir = Path(knowledge_dir)
+        self.index_path = self.knowledge_dir / INDEX_FILENAME
+        self.embedding_model = embedding_model
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self._embedder = embedder
+        # relative path -> {"sha256": ..., "chunks": [{"text": ..., "embedding": [...]}]}
+        self.files: Dict[str, Dict] = {}
+
+    @property
+    def embedder(self) -> Embedder:
+        if self._embedder is None:
+            self._embedder = openai_embedder(self.embedding_model)
+        return self._embedder
+
+    def _settings(self) -> Dict:
+        return {"model": self.embedding_model, "chunk_size": self.chunk_size, "overlap": self.overlap}
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load the persisted index, discarding it if it was built with other settings."""
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if data.get("settings") != self._settings():
+            return {}
+        return data.get("files", {})
+
+    def _save(self) -> None:
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"settings": self._settings(), "files": self.files}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Sync the index with the knowledge directory.
+
+        Unchanged files (same content hash, even if renamed) reuse their stored
+        embeddings; only new or modified files are chunked and embedded.
+        Returns counts of reused, embedded and removed files.
+        """
+        previous = self._load()
+        by_hash = {entry["sha256"]: entry for entry in previous.values()}
+
+        files: Dict[str, Dict] = {}
+        pending: Dict[str, List[str]] = {}
+        pending_hashes: Dict[str, str] = {}
+        reused = 0
+
+        if self.knowledge_dir.is_dir():
+            for path in sorted(self.knowledge_dir.rglob("*")):
+                if not path.is_file() or path.suffix.lower() not in DEFAULT_EXTENSIONS:
+                    continue
+                name = str(path.relative_to(self.knowledge_dir))
+                content = path.read_text(encoding="utf-8")
+                sha256 = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+                if sha256 in by_hash:
+                    files[name] = {"sha256": sha256, "chunks": by_hash[sha256]["chunks"]}
+                    reused += 1
+                else:
+                    pending[name] = chunk_text(content, self.chunk_size, self.overlap)
+                    pending_hashes[name] = sha256
+
+        # Embed every changed file in one batch call
+        texts = [chunk for chunks in pending.values() for chunk in chunks]
+        vectors = iter(self.embedder(texts)) if texts else iter(())
+        for name, chunks in pending.items():
+            files[name] = {
+                "sha256": pending_hashes[name],
+                "chunks": [{"text": chunk, "embedding": _normalize(next(vectors))} for chunk in chunks],
+            }
+
+        removed = len(set(previous) - set(files))
+        self.files = files
+        if pending or set(previous) != set(files):
+            self._save()
+
+        return {"reused": reused, "embedded": len(pending), "removed": removed}
+
+    def search(self, query: str, top_k: int = 3) -> List[Dict]:
+        """Return the top_k chunks most similar to the query, best first."""
+        candidates = [
+            (name, chunk)
+            for name, entry in self.files.items()
+            for chunk in entry["chunks"]
+        ]
+        if not candidates:
+            return []
+
+        query_vector = _normalize(self.embedder([query])[0])
+        scored = (
+            (sum(q * c for q, c in zip(query_vector, chunk["embedding"])), name, chunk["text"])
+            for name, chunk in candidates
+        )
+        return [
+            {"source": name, "score": score, "text": text}
+            for score, name, text in heapq.nlargest(top_k, scored, key=lambda item: item[0])
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_knowledge_index(knowledge_dir: str = DEFAULT_KNOWLEDGE_DIR) -> KnowledgeIndex:
+    """Load and refresh the shared index once per process."""
+    index = KnowledgeIndex(knowledge_dir)
+    index.refresh()
+    return index
@@ -0,0 +1,287 @@
+"""
+Per-agent model routing for the crew.
+
+Mechanical agents run on a fast, cheap model and PRD/issue writing runs on a
+large one. Tool results of fast-tier agents are recorded, and when a task
+fails validation the agent is escalated to the large model and the task is
+retried once. Task latencies are recorded per model so each run can report
+the latency saved by routing.
+"""
+import json
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from crewai import LLM
+from crewai.events import TaskStartedEvent, crewai_event_bus
+
+FAST = "fast"
+LARGE = "large"
+
+DEFAULT_MODELS = {
+    FAST: "gpt-4o-mini",
+    LARGE: "gpt-4o",
+}
+
+STATS_PATH = ".model_routing_stats.json"
+# Latencies kept per task/model pair for the baseline estimate
+HISTORY_SIZE = 20
+
+# Every tool in this project reports failures as a string with one of these prefixes
+TOOL_ERROR_PREFIXES = ("Error", "GitHub API Error")
+
+
+@dataclass
+class ToolCall:
+    tool: str
+    result: str
+
+    @property
+    def failed(self) -> bool:
+        return self.result.startswith(TOOL_ERROR_PREFIXES)
+
+
+def _cache_successes_only(_arguments=None, result=None) -> bool:
+    return not str(result).startswith(TOOL_ERROR_PREFIXES)
+
+
+# (task output, tool calls made by the agent so far) -> error message or None
+Validator = Callable[[str, List[ToolCall]], Optional[str]]
+
+
+def tier_models() -> Dict[str, str]:
+    """Model names per tier, overridable via FAST_MODEL / LARGE_MODEL."""
+    return {
+        FAST: os.getenv("FAST_MODEL", DEFAULT_MODELS[FAST]),
+        LARGE: os.getenv("LARGE_MODEL", DEFAULT_MODELS[LARGE]),
+    }
+
+
+def _extract_json(text: str) -> Optional[Dict]:
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    try:
+        return json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+
+
+def validate_prd_data(output: str, calls: List[ToolCall]) -> Optional[str]:
+    """Check the PRD analysis is JSON with a project name and features."""
+    data = _extract_json(output)
+    if data is None:
+        return "Output must be a valid JSON object with the extracted PRD data."
+    if not data.get("project_name"):
+        return "The JSON output is missing 'project_name'."
+    if not data.get("features"):
+        return "The JSON output must include a non-empty 'features' list."
+    return None
+
+
+def validate_repository(output: str, calls: List[ToolCall]) -> Optional[str]:
+    """
+    Check the repository setup from the tool results rather than the final answer.
+
+    The repository must have been created by a call in this run; once it has,
+    later "already exists" errors from retries are expected and ignored. Any
+    other tool whose latest call failed is reported so only that step is redone.
+    """
+    creates = [call for call in calls if call.tool == "create_github_repository"]
+    if not any(not call.failed for call in creates):
+        reason = creates[-1].result if creates else "create_github_repository was not called"
+        return (
+            f"The repository was not created ({reason}). Fix the cause, e.g. pick another name "
+            "if it already existed before this run, then finish the remaining steps."
+        )
+
+    latest: Dict[str, ToolCall] = {}
+    for call in calls:
+        if call.tool != "create_github_repository":
+            latest[call.tool] = call
+    failed = [call for call in latest.values() if call.failed]
+    if failed:
+        steps = "; ".join(f"{call.tool}: {call.result}" for call in failed)
+        return (
+            "The repository already exists, do not create it again. "
+            f"Retry only these failed steps: {steps}"
+        )
+    return None
+
+
+@dataclass
+class TaskTiming:
+    task: str
+    agent: str
+    model: str
+    seconds: float
+    escalated: bool = False
+
+
+class ModelRouter:
+    """Assigns models to agents, escalates on failed validation and tracks latency."""
+
+    def __init__(self, agent_tiers: Dict[str, str], stats_path: str = STATS_PATH):
+        self.agent_tiers = agent_tiers
+        self.models = tier_models()
+        # MODEL_ROUTING=off runs every agent on the large model, e.g. to collect baselines
+        self.enabled = os.getenv("MODEL_ROUTING", "on").lower() not in ("off", "0", "false")
+        self.stats_path = stats_path
+        self.current_model: Dict[str, str] = {}
+        self.escalated: Dict[str, bool] = {}
+        self.tool_calls: Dict[str, List[ToolCall]] = defaultdict(list)
+        self.timings: List[TaskTiming] = []
+        self._mark = time.perf_counter()
+        # Agents that actually ran each task, by role. crewAI's train/test run
+        # copies of the crew, so escalation must target these, not the originals.
+        self._running_agents: Dict[str, Any] = {}
+        self._escalated_agents: Dict[str, Any] = {}
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def _record_running_agent(source, event):
+            task = getattr(event, "task", None) or source
+            running_agent = getattr(task, "agent", None)
+            if running_agent is not None:
+                self._running_agents[running_agent.role] = running_agent
+
+    def llm_for(self, agent_name: str) -> LLM:
+        tier = self.agent_tiers.get(agent_name, LARGE) if self.enabled else LARGE
+        model = self.models[tier]
+        self.current_model[agent_name] = model
+        return LLM(model=model)
+
+    def _escalates(self, agent_name: str) -> bool:
+        return self.enabled and self.agent_tiers.get(agent_name, LARGE) == FAST
+
+    def track_tools(self, agent_name: str, tools: list) -> list:
+        """Record every tool result of a fast-tier agent for its task guardrail."""
+        if not self._escalates(agent_name):
+            return tools
+
+        calls = self.tool_calls[agent_name]
+        for tool in tools:
+            def tracked(*args, _run=tool._run, _name=tool.name, **kwargs):
+                result = _run(*args, **kwargs)
+                calls.append(ToolCall(tool=_name, result=str(result)))
+                return result
+
+            # BaseTool is a pydantic model, so bypass its attribute validation
+            object.__setattr__(tool, "_run", tracked)
+            # crewAI caches tool results by arguments; a cached error would make
+            # the escalated retry of a failed step return that error without running
+            tool.cache_function = _cache_successes_only
+        return tools
+
+    def escalating_guardrail(self, agent_name: str, agent, validator: Validator):
+        """
+        Build a task guardrail for a fast-tier agent, or None for any other agent.
+
+        When validation fails the agent is swapped to the large model and crewAI
+        retries the task once. If the large model fails validation too, the output
+        is accepted with a warning so the crew run continues as it would without
+        routing.
+        """
+        if not self._escalates(agent_name):
+            return None
+
+        calls = self.tool_calls[agent_name]
+
+        def guardrail(output) -> Tuple[bool, Any]:
+            error = validator(output.raw, calls)
+            if error is None:
+                return True, output
+
+            if self.escalated.get(agent_name):
+                print(f"⚠ {agent_name}: still failing validation on the large model, continuing: {error}")
+                return True, output
+
+            large_model = self.models[LARGE]
+            running_agent = self._running_agents.get(output.agent, agent)
+            running_agent.llm = LLM(model=large_model)
+            self.current_model[agent_name] = large_model
+            self.escalated[agent_name] = True
+            self._escalated_agents[agent_name] = running_agent
+            print(f"⚠ {agent_name}: failed validation, escalating to {large_model}")
+            return False, error
+
+        return guardrail
+
+    def start_run(self) -> None:
+        """Reset per-kickoff state; train/test kick off the same crew repeatedly."""
+        self.timings = []
+        for calls in self.tool_calls.values():
+            # Cleared in place: tracked tools and guardrails hold these lists
+            calls.clear()
+        for agent_name, escalated_agent in self._escalated_agents.items():
+            escalated_agent.llm = self.llm_for(agent_name)
+        self._escalated_agents.clear()
+        self.escalated.clear()
+        self._running_agents.clear()
+        self._mark = time.perf_counter()
+
+    def task_callback(self, task_name: str, agent_name: str):
+        """Build a Task callback that records how long the task took (including retries)."""
+        def callback(output) -> None:
+            now = time.perf_counter()
+            self.timings.append(TaskTiming(
+                task=task_name,
+                agent=agent_name,
+                model=self.current_model.get(agent_name, self.models[LARGE]),
+                seconds=now - self._mark,
+                escalated=self.escalated.get(agent_name, False),
+            ))
+            self._mark = now
+
+        return callback
+
+    def _load_stats(self) -> Dict[str, Dict[str, List[float]]]:
+        try:
+            with open(self.stats_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_stats(self, stats: Dict[str, Dict[str, List[float]]]) -> None:
+        with open(self.stats_path, "w", encoding="utf-8") as f:
+            json.dump(stats, f, indent=2)
+
+    def report(self) -> float:
+        """
+        Print per-task latency for this run and persist it to the stats file.
+
+        Latency saved is estimated against the historical mean latency of the
+        same task on the large model (collect it with MODEL_ROUTING=off);
+        tasks without a baseline are skipped.
+        Returns the total estimated seconds saved.
+        """
+        stats = self._load_stats()
+        large_model = self.models[LARGE]
+        total_saved = 0.0
+
+        print("\n" + "=" * 50)
+        print("Model Routing Report")
+        print("=" * 50)
+        for timing in self.timings:
+            baseline = stats.get(timing.task, {}).get(large_model)
+            saved = ""
+            # Escalated tasks count too: the failed fast attempt is latency lost
+            if (timing.model != large_model or timing.escalated) and baseline:
+                delta = sum(baseline) / len(baseline) - timing.seconds
+                total_saved += delta
+                saved = f", saved {delta:+.1f}s"
+            escalated = " (escalated)" if timing.escalated else ""
+            print(f"  {timing.task}: {timing.model}{escalated} {timing.seconds:.1f}s{saved}")
+
+        for timing in self.timings:
+            if timing.escalated:
+                # Includes the failed fast-model attempt, so it's no baseline for either model
+                continue
+            history = stats.setdefault(timing.task, {}).setdefault(timing.model, [])
+            history.append(round(timing.seconds, 3))
+            del history[:-HISTORY_SIZE]
+        self._save_stats(stats)
+
+        print(f"  Estimated latency saved: {total_saved:.1f}s")
+        return total_saved
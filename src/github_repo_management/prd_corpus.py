@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+"""
+Bulk PRD parsing built on PRDParserTool.
+
+Re-parses an archive of PRDs (a directory of files or a JSONL file) across a
+process pool and streams one JSON result per document to a JSONL output file.
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from github_repo_management.tools import PRDParserTool
+
+DEFAULT_EXTENSIONS = (".md", ".txt")
+
+# (doc_id, path, content, error) - directory sources pass only the path so workers
+# read the file themselves instead of pickling its content through the pool.
+# Records that could not be read carry an error instead and are reported as failures.
+WorkItem = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+_parser: Optional[PRDParserTool] = None
+
+
+@dataclass
+class CorpusStats:
+    """Summary of a bulk parsing run."""
+    documents: int = 0
+    failures: int = 0
+    total_bytes: int = 0
+    elapsed_seconds: float = 0.0
+    peak_rss_kb: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def iter_directory(directory: str, extensions=DEFAULT_EXTENSIONS) -> Iterator[WorkItem]:
+    """Yield work items for every PRD file under a directory, in sorted order."""
+    root = Path(directory)
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.suffix.lower() in extensions:
+            yield str(path.relative_to(root)), str(path), None, None
+
+
+def iter_jsonl(jsonl_path: str, content_key: str = "prd_content", id_key: str = "id") -> Iterator[WorkItem]:
+    """Yield work items from a JSONL file with one PRD record per line."""
+    with open(jsonl_path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield str(line_number), None, None, f"Invalid JSON record: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield str(line_number), None, None, "Invalid JSON record: expected an object"
+                continue
+
+            doc_id = str(record.get(id_key, line_number))
+            content = record.get(content_key)
+            if not isinstance(content, str):
+                yield doc_id, None, None, f"Record has no '{content_key}' string"
+                continue
+            yield doc_id, None, content, None
+
+
+def iter_source(source: str) -> Iterator[WorkItem]:
+    """Pick the right reader for a directory or JSONL source."""
+    if os.path.isdir(source):
+        return iter_directory(source)
+    return iter_jsonl(source)
+
+
+def _init_worker() -> None:
+    """Build one parser per worker process instead of one per document."""
+    global _parser
+    _parser = PRDParserTool()
+
+
+def _parse_item(item: WorkItem) -> Dict:
+    doc_id, path, content, error = item
+    if error is not None:
+        return {"id": doc_id, "bytes": 0, "error": error}
+    if content is None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            # Report unreadable files per document rather than failing the whole chunk
+            return {"id": doc_id, "bytes": 0, "error": f"Error reading PRD: {e}"}
+
+    parser = _parser or PRDParserTool()
+    output = parser._run(prd_content=content)
+    size = len(content.encode("utf-8"))
+    try:
+        return {"id": doc_id, "bytes": size, "result": json.loads(output)}
+    except json.JSONDecodeError:
+        # PRDParserTool reports failures as plain "Error parsing PRD: ..." text
+        return {"id": doc_id, "bytes": size, "error": output}
+
+
+def peak_rss_kb() -> Dict[str, int]:
+    """Peak resident set size of this process and its largest reaped child."""
+    # ru_maxrss is reported in bytes on macOS and kilobytes everywhere else
+    scale = 1024 if sys.platform == "darwin" else 1
+    return {
+        "parent": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale,
+    }
+
+
+def _bounded(items, slots: threading.Semaphore, stop: threading.Event):
+    """Yield items only while a slot is free, so the pool can't read ahead unboundedly."""
+    for item in items:
+        while not slots.acquire(timeout=0.1):
+            if stop.is_set():
+                return
+        yield item
+
+
+def parse_corpus(
+    items,
+    output_path: str,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> CorpusStats:
+    """
+    Parse every work item with PRDParserTool and stream results to output_path.
+
+    Items are dispatched to the pool in chunks to amortise IPC overhead, and
+    results are written in input order as soon as they are available.
+    Pool.imap would otherwise drain the whole input into its task queue up
+    front, so at most two chunks per worker are kept in flight.
+    With workers=1 the parsing runs in-process, which is handy for debugging.
+    """
+    stats = CorpusStats()
+    start = time.perf_counter()
+
+    with open(output_path, "w", encoding="utf-8") as out:
+        if workers == 1:
+            _init_worker()
+            results = map(_parse_item, items)
+            _write_results(results, out, stats)
+        else:
+            processes = workers or os.cpu_count() or 1
+            slots = threading.Semaphore(max(chunksize, 1) * processes * 2)
+            stop = threading.Event()
+            with Pool(processes=processes, initializer=_init_worker) as pool:
+                try:
+                    results = pool.imap(_parse_item, _bounded(items, slots, stop), chunksize=chunksize)
+                    _write_results(results, out, stats, on_result=slots.release)
+                finally:
+                    # Unblock the pool's feeder thread so the pool can shut down on errors
+                    stop.set()
+                pool.close()
+                pool.join()
+
+    stats.elapsed_seconds = time.perf_counter() - start
+    stats.peak_rss_kb = peak_rss_kb()
+    return stats
+
+
+def _write_results(results, out, stats: CorpusStats, on_result=None) -> None:
+    for record in results:
+        if on_result is not None:
+            on_result()
+        stats.documents += 1
+        stats.total_bytes += record.pop("bytes")
+        if "error" in record:
+            stats.failures += 1
+        out.write(json.dumps(record) + "\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Parse a directory or JSONL archive of PRDs in bulk.
+
+    Usage: parse_prds <source> <output.jsonl> [--workers N] [--chunksize N]
+    Exits with status 1 if any document failed to parse.
+    """
+    parser = argparse.ArgumentParser(description="Bulk-parse PRDs with PRDParserTool")
+    parser.add_argument("source", help="Directory of .md/.txt PRDs or a JSONL file with a 'prd_content' field")
+    parser.add_argument("output", help="Path of the JSONL file to write results to")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=16, help="Documents dispatched per worker task")
+    args = parser.parse_args(argv)
+
+    stats = parse_corpus(iter_source(args.source), args.output, workers=args.workers, chunksize=args.chunksize)
+
+    print(f"✓ Parsed {stats.documents} PRDs ({stats.failures} failed) in {stats.elapsed_seconds:.2f}s")
+    print(f"  Throughput: {stats.docs_per_second:.1f} docs/s")
+    print(f"  Peak RSS: parent {stats.peak_rss_kb['parent']} KB, worker {stats.peak_rss_kb['children']} KB")
+    return 1 if stats.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
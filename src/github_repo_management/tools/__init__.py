@@ -5,6 +5,7 @@ from .github_tools import (
     UpdateReadmeTool
 )
 from .prd_parser import PRDParserTool
+from .knowledge_search import KnowledgeSearchTool
 
 __all__ = [
     # GitHub tools
@@ -13,5 +14,7 @@ __all__ = [
     'CreateLabelsTool',
     'UpdateReadmeTool',
     # PRD tools
-    'PRDParserTool'
+    'PRDParserTool',
+    # Knowledge tools
+    'KnowledgeSearchTool'
 ]
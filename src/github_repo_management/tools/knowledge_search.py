@@ -0,0 +1,35 @@
+from crewai.tools import BaseTool
+from typing import Type
+from pydantic import BaseModel, Field
+
+from github_repo_management.knowledge_index import DEFAULT_KNOWLEDGE_DIR, get_knowledge_index
+
+
+class KnowledgeSearchInput(BaseModel):
+    """Input schema for KnowledgeSearchTool."""
+    query: str = Field(..., description="What to look up in the project knowledge base")
+    top_k: int = Field(default=3, description="Number of passages to return")
+
+
+class KnowledgeSearchTool(BaseTool):
+    name: str = "search_project_knowledge"
+    description: str = (
+        "Searches the project knowledge base (user preferences, house style guides, past PRDs) "
+        "and returns the most relevant passages with their source file."
+    )
+    args_schema: Type[BaseModel] = KnowledgeSearchInput
+    knowledge_dir: str = DEFAULT_KNOWLEDGE_DIR
+
+    def _run(self, query: str, top_k: int = 3) -> str:
+        try:
+            # The index is built lazily on first use and shared across agents
+            results = get_knowledge_index(self.knowledge_dir).search(query, top_k=top_k)
+            if not results:
+                return "No relevant knowledge found."
+
+            return "\n\n".join(
+                f"[{result['source']}] (score {result['score']:.2f})\n{result['text']}"
+                for result in results
+            )
+        except Exception as e:
+            return f"Error searching knowledge: {str(e)}"
@@ -0,0 +1,40 @@
+import pytest
+
+from github_repo_management.knowledge_index import chunk_text
+
+
+def test_chunk_text_makes_progress_past_long_tokens():
+    # The only space in range sits exactly at start + overlap, followed by a
+    # token longer than the window; this used to loop forever.
+    text = "x" * 200 + " " + "Z" * 900 + " tail"
+    chunks = chunk_text(text, chunk_size=1000, overlap=200)
+
+    assert chunks[0].startswith("x")
+    assert chunks[-1].endswith("tail")
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+
+
+def test_chunk_text_small_window_with_long_token():
+    text = "word " + "y" * 40 + " end"
+    chunks = chunk_text(text, chunk_size=15, overlap=7)
+
+    assert chunks[-1].endswith("end")
+    assert all(len(chunk) <= 15 for chunk in chunks)
+
+
+def test_chunk_text_starts_and_ends_on_word_boundaries():
+    words = [f"word{i}" for i in range(500)]
+    chunks = chunk_text(" ".join(words), chunk_size=100, overlap=30)
+
+    vocabulary = set(words)
+    for chunk in chunks:
+        assert chunk.split()[0] in vocabulary
+        assert chunk.split()[-1] in vocabulary
+    assert chunks[0].split()[0] == "word0"
+    assert chunks[-1].split()[-1] == "word499"
+
+
+@pytest.mark.parametrize("overlap", [100, 150])
+def test_chunk_text_rejects_overlap_not_smaller_than_chunk_size(overlap):
+    with pytest.raises(ValueError):
+        chunk_text("some text " * 50, chunk_size=100, overlap=overlap)